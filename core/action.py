@@ -2,8 +2,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 
-from core.simulation_state import SimulationStateProvider
-
 
 class ActionStatus(Enum):
     NOT_STARTED = "not_started"
@@ -11,7 +9,7 @@ class ActionStatus(Enum):
     STOPPED = "stopped"
     COMPLETED = "completed"
 
-@dataclass
+@dataclass(slots=True)
 class Action(ABC):
     """
     Base class for all actions in the system.
@@ -27,27 +25,27 @@ class Action(ABC):
     tick_completed: int | None = None
     tick_stopped: int | None = None
 
-    def start(self):
+    def start(self, current_tick: int):
         """
         Initiates the action.
         This method can be overridden by subclasses to define specific start behavior.
         """
         self.status = ActionStatus.IN_PROGRESS
         if self.tick_started is None:
-            self.tick_started = SimulationStateProvider.get_current_tick()
+            self.tick_started = current_tick
 
-    def stop(self):
+    def stop(self, current_tick: int):
         """
         Stops the action.
         This method can be overridden by subclasses to define specific stop behavior.
         """
         self.status = ActionStatus.STOPPED
-        self.tick_stopped = SimulationStateProvider.get_current_tick()
+        self.tick_stopped = current_tick
 
     @abstractmethod
-    def step(self):
+    def step(self, state):
         """
-        Advances the action by one time step.
+        Advances the action by one time step, applying its effect to the given simulation state.
         This method can be overridden by subclasses to define specific step behavior.
         """
         ...
@@ -59,12 +57,12 @@ class Action(ABC):
         """
         return self.status == ActionStatus.COMPLETED
 
-    def complete(self):
+    def complete(self, current_tick: int):
         """
         Marks the action as completed and records when it finished.
         """
         self.status = ActionStatus.COMPLETED
-        self.tick_completed = SimulationStateProvider.get_current_tick()
+        self.tick_completed = current_tick
 
     def has_elapsed_duration(self, current_tick: int) -> bool:
         """
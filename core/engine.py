@@ -1,4 +1,8 @@
+import heapq
+import logging
+import queue
 from dataclasses import dataclass, field
+from operator import itemgetter
 
 from core.action import Action, ActionStatus
 from core.environment import Environment
@@ -6,12 +10,19 @@ from core.event import Event, EventStatus
 from core.objective import Objective, ObjectiveStatus
 from core.simulation_state import SimulationStateProvider
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class Engine:
     """
     The main simulation engine responsible for managing the simulation state,
     including the execution of objectives and the progression of time.
+    Actions, events and objectives are indexed by the engine; after
+    construction the `actions`, `events` and `objectives` lists are
+    append-only. New entries, whether added via execute_action/add_event/
+    add_objective or appended directly, are picked up at the start of the
+    next step.
     """
 
     environment: Environment
@@ -19,60 +30,180 @@ class Engine:
     events: list[Event] = field(default_factory=list)
     objectives: list[Objective] = field(default_factory=list)
 
+    # Actions that may still change state (NOT_STARTED or IN_PROGRESS); the
+    # full history stays in `actions`.
+    _active_actions: list[Action] = field(default_factory=list, init=False, repr=False)
+    # Actions submitted via execute_action, picked up at the start of the next step.
+    _submitted_actions: queue.SimpleQueue = field(default_factory=queue.SimpleQueue, init=False, repr=False)
+    # Events waiting for their start tick, as a heap of (tick_start, index, event),
+    # and running events as (index, event) pairs kept in `events` order.
+    _pending_events: list[tuple[int, int, Event]] = field(default_factory=list, init=False, repr=False)
+    _running_events: list[tuple[int, Event]] = field(default_factory=list, init=False, repr=False)
+    # Objectives that are neither completed nor failed.
+    _active_objectives: list[Objective] = field(default_factory=list, init=False, repr=False)
+    # Number of leading `actions`/`events`/`objectives` entries already indexed.
+    _indexed_actions: int = field(default=0, init=False, repr=False)
+    _indexed_events: int = field(default=0, init=False, repr=False)
+    _indexed_objectives: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self):
+        self._index_new_actions()
+        self._index_new_events()
+        self._index_new_objectives()
+
+    def add_event(self, event: Event):
+        """
+        Adds an event to the simulation.
+        It starts once its tick_start is reached, at the earliest on the next step.
+        """
+        self.events.append(event)
+        self._index_new_events()
+
+    def add_objective(self, objective: Objective):
+        """
+        Adds an objective to the simulation.
+        It is started on the next step.
+        """
+        self.objectives.append(objective)
+        self._index_new_objectives()
+
+    def _index_new_actions(self):
+        """
+        Indexes the actions appended to `actions` since the last call.
+        """
+        for index in range(self._indexed_actions, len(self.actions)):
+            action = self.actions[index]
+            if action.status in (ActionStatus.NOT_STARTED, ActionStatus.IN_PROGRESS):
+                self._active_actions.append(action)
+        self._indexed_actions = len(self.actions)
+
+    def _index_new_events(self):
+        """
+        Indexes the events appended to `events` since the last call.
+        """
+        for index in range(self._indexed_events, len(self.events)):
+            event = self.events[index]
+            if event.status is EventStatus.NOT_STARTED:
+                heapq.heappush(self._pending_events, (event.tick_start, index, event))
+            elif event.status is EventStatus.IN_PROGRESS:
+                # indices only grow, so appending keeps `events` order
+                self._running_events.append((index, event))
+        self._indexed_events = len(self.events)
+
+    def _index_new_objectives(self):
+        """
+        Indexes the objectives appended to `objectives` since the last call.
+        """
+        for index in range(self._indexed_objectives, len(self.objectives)):
+            objective = self.objectives[index]
+            if objective.status in (ObjectiveStatus.NOT_STARTED, ObjectiveStatus.IN_PROGRESS):
+                self._active_objectives.append(objective)
+        self._indexed_objectives = len(self.objectives)
+
     def step(self):
         """
         Advances the simulation by one time step.
         This method updates the simulation state and triggers any necessary events.
         """
-        current_tick = SimulationStateProvider.get_current_tick()
+        state = SimulationStateProvider.state
+        current_tick = state.current_tick
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # local aliases keep the status checks below off the global/attribute lookup path
+        action_in_progress, action_not_started = ActionStatus.IN_PROGRESS, ActionStatus.NOT_STARTED
+        event_in_progress, event_not_started = EventStatus.IN_PROGRESS, EventStatus.NOT_STARTED
+        objective_in_progress, objective_not_started = ObjectiveStatus.IN_PROGRESS, ObjectiveStatus.NOT_STARTED
+
+        # 0. Take in entries appended and actions submitted since the last step
+        if len(self.actions) != self._indexed_actions:
+            self._index_new_actions()
+        self._drain_submitted_actions()
+        if len(self.events) != self._indexed_events:
+            self._index_new_events()
+        if len(self.objectives) != self._indexed_objectives:
+            self._index_new_objectives()
 
         # 1. Advance the environment
-        self.environment.step()
-
-        # 2. Advance in-progress actions
-        for action in self.actions:
-            match action.status:
-                case ActionStatus.IN_PROGRESS:
-                    action.step()
-                    if action.status is ActionStatus.IN_PROGRESS and action.has_elapsed_duration(current_tick):
-                        action.complete()
-                case ActionStatus.NOT_STARTED:
-                    action.start()
-            print("==== Actions ====")
-            print(current_tick)
-            print(action.get_tool_description)
-            print(action.tick_started)
-            print(action.tick_completed)
-            print("==== ====")
-
-        # 3. Advance events and objectives
-        for event in self.events:
-            if event.status is EventStatus.NOT_STARTED and current_tick >= event.tick_start:
-                event.start()
-
-            if event.status is EventStatus.IN_PROGRESS:
-                event.step()
+        self.environment.step(state)
+
+        # 2. Advance in-progress actions, dropping the ones that finished
+        active_actions = []
+        for action in self._active_actions:
+            if action.status is action_in_progress:
+                action.step(state)
+                if action.status is action_in_progress and action.has_elapsed_duration(current_tick):
+                    action.complete(current_tick)
+            elif action.status is action_not_started:
+                action.start(current_tick)
+            if debug:
+                logger.debug(
+                    "[tick %d] action=%s started=%s completed=%s",
+                    current_tick,
+                    type(action).__name__,
+                    action.tick_started,
+                    action.tick_completed,
+                )
+            if action.status is action_in_progress:
+                active_actions.append(action)
+        self._active_actions = active_actions
+
+        # 3. Move due events next to the running ones, then start and advance
+        # them in `events` order
+        pending_events = self._pending_events
+        if pending_events and pending_events[0][0] <= current_tick:
+            while pending_events and pending_events[0][0] <= current_tick:
+                _, index, event = heapq.heappop(pending_events)
+                self._running_events.append((index, event))
+            self._running_events.sort(key=itemgetter(0))
+
+        running_events = []
+        for index, event in self._running_events:
+            if event.status is event_not_started:
+                event.start(current_tick)
+            if event.status is event_in_progress:
+                event.step(state)
 
                 if event.has_elapsed_duration(current_tick):
-                    event.complete()
-            print(str(current_tick)+"  " +str(event.status))
+                    event.complete(current_tick)
+            if debug:
+                logger.debug("[tick %d] event=%s status=%s", current_tick, type(event).__name__, event.status)
+            if event.status is event_in_progress:
+                running_events.append((index, event))
+        self._running_events = running_events
 
-        # 4. Advance objectives
-        for objective in self.objectives:
-            match objective.status:
-                case ObjectiveStatus.IN_PROGRESS:
-                    objective.check_completion()
-                case ObjectiveStatus.NOT_STARTED:
-                    objective.start()
+        # 4. Advance objectives, dropping the ones that completed or failed
+        active_objectives = []
+        for objective in self._active_objectives:
+            if objective.status is objective_in_progress:
+                objective.check_completion(state, current_tick)
+            elif objective.status is objective_not_started:
+                objective.start()
+            if objective.status is objective_in_progress:
+                active_objectives.append(objective)
+        self._active_objectives = active_objectives
 
     def execute_action(self, action_cls: type[Action], parameters: dict):
         """
         Executes a given action with the specified parameters.
-        This method adds the action to the list of active actions in the simulation.
+        The action is instantiated right away and joins the simulation at the start of the next step.
+        Safe to call from a thread other than the one driving step().
         """
         # create an instance of the action
         action_instance = action_cls(**parameters)
-        self.actions.append(action_instance)
+        self._submitted_actions.put(action_instance)
+
+    def _drain_submitted_actions(self):
+        """
+        Moves all submitted actions into the simulation.
+        """
+        while True:
+            try:
+                action_instance = self._submitted_actions.get_nowait()
+            except queue.Empty:
+                return
+            self.actions.append(action_instance)
+            self._active_actions.append(action_instance)
+            self._indexed_actions += 1
 
     def metrics(self) -> dict:
         """
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Environment(ABC):
     """
     A class representing the environment where the agent operates.
@@ -10,9 +10,9 @@ class Environment(ABC):
     """
 
     @abstractmethod
-    def step(self):
+    def step(self, state):
         """
         Advances the environment by one time step.
-        This method should update the state of the environment based on its dynamics.
+        This method should update the given simulation state based on its dynamics.
         """
         ...
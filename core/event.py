@@ -2,15 +2,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 
-from core.simulation_state import SimulationStateProvider
-
 
 class EventStatus(Enum):
     NOT_STARTED = "not_started"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
 
-@dataclass
+@dataclass(slots=True)
 class Event(ABC):
     """
     Base class for all events in the system.
@@ -22,20 +20,20 @@ class Event(ABC):
     tick_started: int | None = None
     tick_completed: int | None = None
 
-    def start(self):
+    def start(self, current_tick: int):
         """
         Starts the event.
         This method should be overridden by subclasses to define specific event behavior.
         """
         self.status = EventStatus.IN_PROGRESS
-        self.tick_started = SimulationStateProvider.get_current_tick()
+        self.tick_started = current_tick
 
-    def complete(self):
+    def complete(self, current_tick: int):
         """
         Completes the event.
         """
         self.status = EventStatus.COMPLETED
-        self.tick_completed = SimulationStateProvider.get_current_tick()
+        self.tick_completed = current_tick
 
     def has_elapsed_duration(self, current_tick: int) -> bool:
         """
@@ -48,9 +46,9 @@ class Event(ABC):
         return ticks_elapsed >= self.tick_duration
 
     @abstractmethod
-    def step(self):
+    def step(self, state):
         """
-        Advances the event by one time step.
+        Advances the event by one time step, applying its effect to the given simulation state.
         This method should be overridden by subclasses to define specific event behavior.
         """
         ...
@@ -34,9 +34,11 @@ def scenario_runner_monkey_patch(
         self.agent_config_builder.build(agent_name=agent)
     )
 
+    base_agent_config = agent_config.get_base_agent_config()
+
     # Set the use_custom_logger parameter in the base agent config
-    agent_config.get_base_agent_config().use_custom_logger = use_custom_logger
-    agent_config.get_base_agent_config().llm_engine_config = LLMEngineConfig(
+    base_agent_config.use_custom_logger = use_custom_logger
+    base_agent_config.llm_engine_config = LLMEngineConfig(
         model_name=model, provider=provider, endpoint=endpoint
     )
 
@@ -44,7 +46,7 @@ def scenario_runner_monkey_patch(
     simulated_generation_time_config = SimulatedGenerationTimeConfig(
         mode=simulated_generation_time_mode  # type: ignore
     )
-    agent_config.get_base_agent_config().simulated_generation_time_config = (
+    base_agent_config.simulated_generation_time_config = (
         simulated_generation_time_config
     )
 
@@ -60,11 +62,12 @@ def agent_step_monkeypatch(self, prompt: list[dict[str, str]]) -> tuple[str | No
     llm_output = None
     metadata = {}
     format_try_count: int = 0
-    
+    action_token, thought_token = self.action_token, self.thought_token
+
     while llm_output is None or (
         self.retry_llm_call_on_error
-        and self.action_token not in llm_output
-        and self.thought_token not in llm_output
+        and action_token not in llm_output
+        and thought_token not in llm_output
     ):
         if llm_output is not None:
             self.logger.warning(
@@ -3,8 +3,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 
-from core.simulation_state import SimulationStateProvider
-
 
 def stochastic(func):
     """
@@ -12,10 +10,12 @@ def stochastic(func):
     Assumes that parent class has a 'probability' attribute.
     """
     def wrapper(self, *args, **kwargs):
-        if not hasattr(self, 'probability'):
-            raise AttributeError("Stochastic methods require a 'probability' attribute.")
-        
-        if random.random() > self.probability:
+        try:
+            probability = self.probability
+        except AttributeError:
+            raise AttributeError("Stochastic methods require a 'probability' attribute.") from None
+
+        if random.random() > probability:
             return  # Skip execution based on probability
 
         return func(self, *args, **kwargs)
@@ -27,7 +27,7 @@ class ObjectiveStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
+@dataclass(slots=True)
 class Objective(ABC):
     """
     Base class for all objectives in the system.
@@ -44,7 +44,7 @@ class Objective(ABC):
         """
         self.status = ObjectiveStatus.IN_PROGRESS
 
-    def check_completion(self):
+    def check_completion(self, state, current_tick: int):
         """
         Advances the objective by one time step.
         This method can be overridden by subclasses to define specific objective behavior.
@@ -52,12 +52,12 @@ class Objective(ABC):
         if self.status != ObjectiveStatus.IN_PROGRESS:
             return
 
-        if self.is_completed(SimulationStateProvider.state):
+        if self.is_completed(state):
             self.status = ObjectiveStatus.COMPLETED
-            self.tick_done = SimulationStateProvider.get_current_tick()
-        elif self.is_failed(SimulationStateProvider.state):
+            self.tick_done = current_tick
+        elif self.is_failed(state):
             self.status = ObjectiveStatus.FAILED
-            self.tick_done = SimulationStateProvider.get_current_tick()
+            self.tick_done = current_tick
 
     @abstractmethod
     def is_completed(self, state) -> bool:
@@ -84,7 +84,7 @@ class StochasticObjective(Objective):
 
     @stochastic
     @abstractmethod
-    def check_completion(self):
+    def check_completion(self, state, current_tick: int):
         """
         Advances the stochastic objective by one time step.
         This method should incorporate randomness in its implementation.
@@ -7,7 +7,7 @@ from core.objective import Objective
 from core.system_prompt import build_system_prompt
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     """
     Base class for all scenarios in the system.
@@ -21,5 +21,5 @@ class Scenario:
     events: list[Event] = field(default_factory=list)
     objectives: list[Objective] = field(default_factory=list)
 
-    system_prompt: str = build_system_prompt()
+    system_prompt: str = field(default_factory=build_system_prompt)
     
\ No newline at end of file
@@ -1,24 +1,44 @@
-import threading
+import logging
+import math
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 
 from core.engine import Engine
 from core.monkey_patch import MonkeyPatch
 from core.scenario import Scenario
-from core.simulation_state import SimulationStateProvider
+from core.simulation_state import SimulationState, SimulationStateProvider
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# Field names per state class, resolved on first use.
+_STATE_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _state_as_dict(state: SimulationState) -> dict:
+    """
+    Maps each field of the state to its current value.
+    Unlike dataclasses.asdict, values are not deep-copied.
+    """
+    names = _STATE_FIELD_NAMES.get(type(state))
+    if names is None:
+        names = _STATE_FIELD_NAMES[type(state)] = tuple(f.name for f in fields(state))
+    return {name: getattr(state, name) for name in names}
+
+
+@dataclass(slots=True)
 class ScenarioRunnerConfig:
     """
     Configuration for the ScenarioRunner.
     """
     max_ticks: int | None = 1000      # Maximum number of ticks to run the scenario - None for unlimited
     agent_delay_ticks: int = 0        # Number of ticks to wait before starting the agent
-    agent_tick_interval: int = 5      # Number of ticks between agent invocations
+    agent_tick_interval: int = 5      # Number of ticks between agent invocations - 0 or less for every tick
     real_time_delay_s: float = 0.1    # Real time delay in seconds between ticks
+    real_time: bool = True            # Pace ticks by real_time_delay_s; disable for batch runs
+    interactive: bool = True          # Wait for Enter before each agent turn
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioRunner:
     """
     The main entry point for running scenarios.
@@ -41,62 +61,43 @@ class ScenarioRunner:
         # create agent
         agent = MonkeyPatch.get_agent(system_prompt=scenario.system_prompt)
 
-        running_condition = lambda _: True
-        if self.config.max_ticks is not None:
-            running_condition = lambda current_tick: current_tick < self.config.max_ticks
-
-        lock = threading.Lock()
-
-        # run agent and simulation in two separate threads
-        def _simulation_loop():
-            while True:
-                # wait for lock
-                lock.acquire()
-                state = SimulationStateProvider.state
-                if state is None or not running_condition(state.current_tick):
-                    break
-                engine.step()
-                state.current_tick += 1
-                lock.release()
-                time.sleep(self.config.real_time_delay_s)
-
-        def _agent_loop():
-
-            # wait for initial delay
-            for _ in range(self.config.agent_delay_ticks):
-                time.sleep(self.config.real_time_delay_s)
-
-            while True:
-                lock.acquire()
+        # resolve the loop's config once so each tick only touches locals
+        max_ticks = self.config.max_ticks if self.config.max_ticks is not None else math.inf
+        agent_delay_ticks = self.config.agent_delay_ticks
+        # an interval of 0 or less means the agent takes a turn every tick
+        agent_tick_interval = max(self.config.agent_tick_interval, 1)
+        real_time = self.config.real_time
+        real_time_delay_s = self.config.real_time_delay_s
+        interactive = self.config.interactive
+
+        def _agent_turn(state):
+            if interactive:
                 input("Press Enter to let the agent take its turn...")
-                state = SimulationStateProvider.state
-                if state is None or not running_condition(state.current_tick):
-                    break
-                ct = state.current_tick
-                prompt = f"Simulation State at tick {ct}: {asdict(state)}"
-                print(f"Agent Prompt at tick {ct}: {prompt}")
-
-                llm_output, parsed_action, metadata = MonkeyPatch.step_agent(agent, prompt)
-                print(f"Agent Thought at tick {ct}: {llm_output}")
-
-                if parsed_action is not None:
-                    # create action instance
-                    print(f"parsed_action: {parsed_action}")
-                    action_cls = scenario.action_registry.get(parsed_action.tool_name, None)
-                    if action_cls is None:
-                        raise ValueError(f"Action '{parsed_action.tool_name}' not found in action registry.")
-
-                    engine.execute_action(action_cls, parsed_action.arguments)
-
-                lock.release()
-                for _ in range(self.config.agent_tick_interval):
-                    time.sleep(self.config.real_time_delay_s)
-
-        agent_thread = threading.Thread(target=_agent_loop)
-        simulation_thread = threading.Thread(target=_simulation_loop)
-
-        agent_thread.start()
-        simulation_thread.start()
-
-        agent_thread.join()
-        simulation_thread.join()
+            ct = state.current_tick
+            prompt = f"Simulation State at tick {ct}: {_state_as_dict(state)}"
+            logger.debug("Agent Prompt at tick %d: %s", ct, prompt)
+
+            llm_output, parsed_action, metadata = MonkeyPatch.step_agent(agent, prompt)
+            logger.debug("Agent Thought at tick %d: %s", ct, llm_output)
+
+            if parsed_action is not None:
+                # create action instance
+                logger.debug("parsed_action: %s", parsed_action)
+                try:
+                    action_cls = scenario.action_registry[parsed_action.tool_name]
+                except KeyError:
+                    raise ValueError(f"Action '{parsed_action.tool_name}' not found in action registry.") from None
+
+                engine.execute_action(action_cls, parsed_action.arguments)
+
+        # run agent turns and simulation ticks in a single loop; the agent acts
+        # on the state at the start of a tick and its action joins that tick's step
+        state = SimulationStateProvider.state
+        while state is not None and state.current_tick < max_ticks:
+            ticks_since_delay = state.current_tick - agent_delay_ticks
+            if ticks_since_delay >= 0 and ticks_since_delay % agent_tick_interval == 0:
+                _agent_turn(state)
+            engine.step()
+            state.current_tick += 1
+            if real_time:
+                time.sleep(real_time_delay_s)
@@ -4,7 +4,7 @@ from typing import Generic, TypeVar
 SimulationStateType = TypeVar("SimulationStateType", bound="SimulationState")
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationState:
     """
     A class representing the state of the simulation environment.
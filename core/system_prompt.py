@@ -1,5 +1,7 @@
 """System prompt template and helper for building environment-specific prompts."""
 
+from functools import lru_cache
+
 SYSTEM_PROMPT_TEMPLATE: str = """
 <general_instructions>
 Your name is MetaOSSAgent, part of the Meta Agents Research Environments. You are an expert assistant helping users with their tasks.
@@ -95,17 +97,32 @@ Today's date in 'YYYY-MM-DD HH' format is 2025-12-06 13
 """
 
 
+def _split_template(template: str) -> tuple[str, str, str]:
+    """Split the template around its two placeholders, resolving str.format brace escapes."""
+    head, rest = template.split("{custom_instructions_block}")
+    middle, tail = rest.split("{custom_tools_block}")
+    return tuple(segment.replace("{{", "{").replace("}}", "}") for segment in (head, middle, tail))
+
+
+# Split once at import so building a prompt is plain concatenation.
+_PROMPT_HEAD, _PROMPT_MIDDLE, _PROMPT_TAIL = _split_template(SYSTEM_PROMPT_TEMPLATE)
+
+
 def _format_block(block: str) -> str:
     """Return a block with trailing newline when provided, else empty string."""
     clean = block.strip()
     return f"{clean}\n" if clean else ""
 
 
+@lru_cache(maxsize=32)
 def build_system_prompt(custom_instructions: str = "", custom_tools: str = "") -> str:
-    """Build a system prompt with optional environment-specific instructions and tools."""
-    return SYSTEM_PROMPT_TEMPLATE.format(
-        custom_instructions_block=_format_block(custom_instructions),
-        custom_tools_block=_format_block(custom_tools),
+    """Build a system prompt with optional environment-specific instructions and tools (memoized)."""
+    return (
+        _PROMPT_HEAD
+        + _format_block(custom_instructions)
+        + _PROMPT_MIDDLE
+        + _format_block(custom_tools)
+        + _PROMPT_TAIL
     )
 
 
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
+from typing import ClassVar
 
 from core.action import Action
 from core.environment import Environment
@@ -11,7 +13,7 @@ from core.system_prompt import build_system_prompt
 
 
 # -------- Simulation State --------
-@dataclass
+@dataclass(slots=True)
 class SimpleSimulationState(SimulationState):
     tree_growth: float = 0.0
 
@@ -19,40 +21,47 @@ SimulationStateProvider.state = SimpleSimulationState()
 
 # -------- Simulation Environment --------
 class SimpleEnvironment(Environment):
-    def step(self):
-        SimulationStateProvider.state.tree_growth += 1.0  # Simple growth logic
+    def step(self, state: SimpleSimulationState):
+        state.tree_growth += 1.0  # Simple growth logic
+
+# -------- Shared Step Behavior --------
+class ConstantGrowthStep:
+    """
+    Mixin for events and actions that change tree growth by a fixed amount every tick.
+    Subclasses compute `growth_delta` once in __post_init__.
+    """
+    __slots__ = ()
+
+    def step(self, state: SimpleSimulationState):
+        state.tree_growth += self.growth_delta
 
 # -------- Event Types --------
-@dataclass
-class BadWeatherEvent(Event):
+@dataclass(slots=True)
+class BadWeatherEvent(ConstantGrowthStep, Event):
     """
     A simple event that negatively affects tree growth.
     """
     description: str = "Bad weather reduces tree growth."
     severity: float = 2.0
+    growth_delta: float = field(init=False, repr=False)
 
-    def affect_environment(self):
-        SimulationStateProvider.state.tree_growth -= self.severity
-
-    def step(self):
-        self.affect_environment()
+    def __post_init__(self):
+        self.growth_delta = -self.severity
 
-@dataclass
-class GoodWeatherEvent(Event):
+@dataclass(slots=True)
+class GoodWeatherEvent(ConstantGrowthStep, Event):
     """
     A simple event that positively affects tree growth.
     """
     description: str = "Good weather increases tree growth."
     boost: float = 3.0
+    growth_delta: float = field(init=False, repr=False)
 
-    def affect_environment(self):
-        SimulationStateProvider.state.tree_growth += self.boost
-
-    def step(self):
-        self.affect_environment()
+    def __post_init__(self):
+        self.growth_delta = self.boost
 
 # -------- Objective Types --------
-@dataclass
+@dataclass(slots=True)
 class GrowTreesObjective(Objective):
     """
     An objective to grow trees to a certain level.
@@ -66,7 +75,7 @@ class GrowTreesObjective(Objective):
     def is_failed(self, state: SimpleSimulationState) -> bool:
         return False  # This objective cannot fail in this simple scenario
 
-@dataclass
+@dataclass(slots=True)
 class GrowTreeQuicklyObjective(Objective):
     """
     An objective to grow trees quickly within a limited number of ticks.
@@ -79,14 +88,13 @@ class GrowTreeQuicklyObjective(Objective):
         return state.tree_growth >= self.target_growth
 
     def is_failed(self, state: SimpleSimulationState) -> bool:
-        current_tick = SimulationStateProvider.get_current_tick()
-        return current_tick > self.max_ticks and state.tree_growth < self.target_growth
+        return state.current_tick > self.max_ticks and state.tree_growth < self.target_growth
 
 # ---------- Agent Action Types ----------
 
 
-@dataclass
-class FertilizeAction(Action):
+@dataclass(slots=True)
+class FertilizeAction(ConstantGrowthStep, Action):
     """
     An action that fertilizes the trees to boost growth.
     """
@@ -95,22 +103,29 @@ class FertilizeAction(Action):
     description: str = """
     Fertilize trees to boost growth.
     """
+    growth_delta: float = field(init=False, repr=False)
+
+    # Built once with the class; the description never changes at runtime.
+    TOOL_DESCRIPTION: ClassVar[dict[str, str]] = {
+        "name": "Fertilize",
+        "description": description,
+        "parameters": {
+            "name": "boost",
+            "type": "float",
+            "description": "The amount to boost tree growth."
+        }
+    }
 
-    def step(self):
-        SimulationStateProvider.state.tree_growth += self.boost / self.ticks_required
-        
+    def __post_init__(self):
+        self.growth_delta = self.boost / self.ticks_required
 
     @staticmethod
     def get_tool_description() -> dict[str, str]:
-        return {
-            "name": "Fertilize",
-            "description": FertilizeAction.description,
-            "parameters": {
-                "name": "boost",
-                "type": "float",
-                "description": "The amount to boost tree growth."
-            }
-        }
+        return FertilizeAction.TOOL_DESCRIPTION
+
+# The runner logs the agent's prompt, thought and parsed action at debug level; show them.
+logging.basicConfig(format="%(message)s")
+logging.getLogger("core.scenario_runner").setLevel(logging.DEBUG)
 
 sr = ScenarioRunner(
     config=ScenarioRunnerConfig(